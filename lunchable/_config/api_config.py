@@ -5,7 +5,6 @@ API Configuration Helper
 import logging
 from os import getenv
 from typing import Dict, List, Optional, Union
-from urllib import parse
 
 from lunchable._version import __version__
 from lunchable.exceptions import EnvironmentVariableError, LunchMoneyError
@@ -110,56 +109,23 @@ class APIConfig:
             raise LunchMoneyError(
                 "You must provide a string or list of strings to construct a URL"
             )
-        path_set = [
-            str(item).lower()
-            for item in url_path
-            if str(item).lower() != APIConfig.LUNCHMONEY_API_PATH
-        ]
-        url = APIConfig._generate_url(
-            scheme=APIConfig.LUNCHMONEY_SCHEME,
-            netloc=APIConfig.LUNCHMONEY_NETLOC,
-            path="/".join([APIConfig.LUNCHMONEY_API_PATH, *path_set]),
+        path_set: List[str] = []
+        for item in url_path:
+            if isinstance(item, int) and not isinstance(item, bool):
+                # IDs never need case-folding and can't collide with the API path,
+                # bools are excluded so they're still lowered ("true" / "false")
+                path_set.append(str(item))
+                continue
+            path_part = str(item).lower()
+            if path_part != APIConfig.LUNCHMONEY_API_PATH:
+                path_set.append(path_part)
+        # Every path part is already URL-safe, so join them directly
+        # rather than round-tripping through urllib.parse.urlunparse
+        url = "/".join(
+            [
+                f"{APIConfig.LUNCHMONEY_SCHEME}://{APIConfig.LUNCHMONEY_NETLOC}",
+                APIConfig.LUNCHMONEY_API_PATH,
+                *path_set,
+            ]
         )
         return url
-
-    @classmethod
-    def _generate_url(
-        cls,
-        scheme: str,
-        netloc: str,
-        path: str = "",
-        params: str = "",
-        query: str = "",
-        fragment: str = "",
-    ) -> str:
-        """
-        Build a URL
-
-        Parameters
-        ----------
-        scheme: str
-            URL scheme specifier
-        netloc: str
-            Network location part
-        path: str
-            Hierarchical path
-        params: str
-            Parameters for last path element
-        query: str
-            Query component
-        fragment: str
-            Fragment identifier
-        Returns
-        -------
-        url: str
-            Compiled URL
-        """
-        url_components = {
-            "scheme": scheme,
-            "netloc": netloc,
-            "path": path,
-            "params": params,
-            "query": query,
-            "fragment": fragment,
-        }
-        return parse.urlunparse(components=tuple(url_components.values()))
@@ -4,13 +4,21 @@ Lunchmoney SDK Core
 
 from __future__ import annotations
 
+import datetime
+import email.utils
+import logging
+import math
+import random
+from asyncio import sleep as _async_sleep
 from functools import cached_property
+from time import sleep as _sleep
 from typing import (
     Any,
     AsyncIterable,
     Iterable,
     Mapping,
     Optional,
+    Tuple,
     Union,
 )
 
@@ -21,15 +29,17 @@ from httpx import Client
 from lunchable._config import APIConfig
 from lunchable.exceptions import LunchMoneyHTTPError
 
+logger = logging.getLogger(__name__)
+
 
 class LunchMoneyClient(Client):
     """
     API HTTP Client
     """
 
-    def __init__(self, access_token: str | None = None) -> None:
+    def __init__(self, access_token: str | None = None, http2: bool = False) -> None:
         timeout = httpx.Timeout(connect=5, read=30, write=20, pool=5)
-        super().__init__(timeout=timeout)
+        super().__init__(timeout=timeout, http2=http2)
         api_headers = APIConfig.get_header(access_token=access_token)
         self.headers.update(api_headers)
 
@@ -39,9 +49,9 @@ class LunchMoneyAsyncClient(httpx.AsyncClient):
     API Async HTTP Client
     """
 
-    def __init__(self, access_token: str | None = None) -> None:
+    def __init__(self, access_token: str | None = None, http2: bool = False) -> None:
         timeout = httpx.Timeout(connect=5, read=30, write=20, pool=5)
-        super().__init__(timeout=timeout)
+        super().__init__(timeout=timeout, http2=http2)
         api_headers = APIConfig.get_header(access_token=access_token)
         self.headers.update(api_headers)
 
@@ -65,7 +75,17 @@ class LunchMoneyAPIClient:
         PATCH = "PATCH"
         DELETE = "DELETE"
 
-    def __init__(self, access_token: str | None = None) -> None:
+    # Keys of a response body that denote an error, in order of precedence
+    _error_keys: Tuple[str, ...] = ("error", "errors")
+    # Upper bound on the wait between rate limited (429) retries, in seconds
+    _max_retry_delay: float = 30.0
+
+    def __init__(
+        self,
+        access_token: str | None = None,
+        rate_limit_retries: int = 5,
+        http2: bool = False,
+    ) -> None:
         """
         Initialize a Lunch Money object with an Access Token.
 
@@ -75,8 +95,20 @@ class LunchMoneyAPIClient:
         ----------
         access_token: Optional[str]
             Lunchmoney Developer API Access Token
+        rate_limit_retries: int
+            How many times to retry a rate limited (HTTP 429) request before
+            returning the 429 response. Set to 0 to disable retries. Defaults to 5.
+        http2: bool
+            Send requests over HTTP/2. Requires the `lunchable[http2]` extra.
+            Defaults to False.
         """
+        if rate_limit_retries < 0:
+            raise ValueError(
+                f"rate_limit_retries must be 0 or greater, got {rate_limit_retries}"
+            )
         self.access_token = APIConfig.get_access_token(access_token=access_token)
+        self.rate_limit_retries = rate_limit_retries
+        self.http2 = http2
 
     def __repr__(self) -> str:
         """
@@ -97,7 +129,7 @@ class LunchMoneyAPIClient:
         -------
         httpx.Client
         """
-        return LunchMoneyClient(access_token=self.access_token)
+        return LunchMoneyClient(access_token=self.access_token, http2=self.http2)
 
     @cached_property
     def async_session(self) -> httpx.AsyncClient:
@@ -108,7 +140,7 @@ class LunchMoneyAPIClient:
         -------
         httpx.AsyncClient
         """
-        return LunchMoneyAsyncClient(access_token=self.access_token)
+        return LunchMoneyAsyncClient(access_token=self.access_token, http2=self.http2)
 
     def request(
         self,
@@ -129,6 +161,9 @@ class LunchMoneyAPIClient:
         This is a simple method :class:`.LunchMoney` exposes to make HTTP requests. It
         has the benefit of using an existing `httpx.Client` as well as as out of the box
         auth headers that are used to connect to the Lunch Money Developer API.
+        Rate limited (HTTP 429) requests are retried with exponential backoff,
+        up to `rate_limit_retries` times, unless the request body is a stream or
+        file that can't be sent again.
 
         Parameters
         ----------
@@ -184,15 +219,22 @@ class LunchMoneyAPIClient:
             response.raise_for_status()
         ```
         """
-        response = self.session.request(
-            method=method,
-            url=url,
-            content=content,
-            data=data,
-            json=json,
-            params=params,
-            **kwargs,
-        )
+        retries = self._retries_for(content=content, data=data, **kwargs)
+        for attempt in range(retries + 1):
+            response = self.session.request(
+                method=method,
+                url=url,
+                content=content,
+                data=data,
+                json=json,
+                params=params,
+                **kwargs,
+            )
+            if not self._should_retry(
+                response=response, attempt=attempt, retries=retries
+            ):
+                break
+            _sleep(self._retry_delay(response=response, attempt=attempt))
         return response
 
     async def arequest(
@@ -214,6 +256,9 @@ class LunchMoneyAPIClient:
         This is a simple method :class:`.LunchMoney` exposes to make HTTP requests. It
         has the benefit of using an existing `httpx.Client` as well as as out of the box
         auth headers that are used to connect to the Lunch Money Developer API.
+        Rate limited (HTTP 429) requests are retried with exponential backoff,
+        up to `rate_limit_retries` times, unless the request body is a stream or
+        file that can't be sent again.
 
         Parameters
         ----------
@@ -239,16 +284,98 @@ class LunchMoneyAPIClient:
         -------
         httpx.Response
         """
-        response = self.async_session.request(
-            method=method,
-            url=url,
-            content=content,
-            data=data,
-            json=json,
-            params=params,
-            **kwargs,
+        retries = self._retries_for(content=content, data=data, **kwargs)
+        for attempt in range(retries + 1):
+            response = await self.async_session.request(
+                method=method,
+                url=url,
+                content=content,
+                data=data,
+                json=json,
+                params=params,
+                **kwargs,
+            )
+            if not self._should_retry(
+                response=response, attempt=attempt, retries=retries
+            ):
+                break
+            await _async_sleep(self._retry_delay(response=response, attempt=attempt))
+        return response
+
+    def _retries_for(
+        self,
+        content: Optional[
+            Union[str, bytes, Iterable[bytes], AsyncIterable[bytes]]
+        ] = None,
+        data: Optional[Mapping[str, Any]] = None,
+        **kwargs: Any,
+    ) -> int:
+        """
+        How many times a request can be retried
+
+        Streaming `content`, non-mapping `data` and `files` are consumed by the
+        first attempt, so requests sending them are never retried.
+        """
+        replayable = (
+            (content is None or isinstance(content, (str, bytes)))
+            and (data is None or isinstance(data, Mapping))
+            and kwargs.get("files") is None
+        )
+        return self.rate_limit_retries if replayable else 0
+
+    @staticmethod
+    def _should_retry(response: httpx.Response, attempt: int, retries: int) -> bool:
+        """
+        Whether a response was rate limited (429) and has retries left
+        """
+        return (
+            response.status_code == httpx.codes.TOO_MANY_REQUESTS and attempt < retries
         )
-        return await response
+
+    @classmethod
+    def _retry_delay(cls, response: httpx.Response, attempt: int) -> float:
+        """
+        Seconds to wait before retrying a rate limited (429) response
+
+        Honors a `Retry-After` header given either as seconds or as an HTTP-date,
+        and otherwise (or if the header is invalid) backs off exponentially. The
+        wait is capped at `_max_retry_delay` and jittered so concurrent callers
+        don't retry in lockstep.
+        """
+        delay = cls._parse_retry_after(response.headers.get("Retry-After"))
+        if delay is None:
+            delay = 2.0**attempt
+        delay = min(delay, cls._max_retry_delay) + random.random()
+        logger.debug(
+            "Rate limited by Lunch Money, retrying %s %s in %.1f seconds",
+            response.request.method,
+            response.request.url,
+            delay,
+        )
+        return delay
+
+    @staticmethod
+    def _parse_retry_after(retry_after: Optional[str]) -> Optional[float]:
+        """
+        Parse a `Retry-After` header into seconds, `None` if missing or invalid
+        """
+        if retry_after is None:
+            return None
+        try:
+            delay = float(retry_after)
+        except ValueError:
+            try:
+                retry_at = email.utils.parsedate_to_datetime(retry_after)
+            except (TypeError, ValueError):
+                return None
+            if retry_at.tzinfo is None:
+                retry_at = retry_at.replace(tzinfo=datetime.timezone.utc)
+            now = datetime.datetime.now(tz=datetime.timezone.utc)
+            # A date in the past means the request can be retried right away
+            return max((retry_at - now).total_seconds(), 0.0)
+        if not math.isfinite(delay) or delay < 0:
+            return None
+        return delay
 
     @classmethod
     def process_response(cls, response: httpx.Response) -> Any:
@@ -266,20 +393,50 @@ class LunchMoneyAPIClient:
             response.raise_for_status()
         except httpx.HTTPError as he:
             raise LunchMoneyHTTPError(response.text) from he
-        if response.content:
-            returned_data = response.json()
-        else:
-            returned_data = None
-        if isinstance(returned_data, dict) and any(
-            ["error" in returned_data.keys(), "errors" in returned_data.keys()]
-        ):
-            try:
-                errors = returned_data["error"]
-            except KeyError:
-                errors = returned_data["errors"]
-            raise LunchMoneyHTTPError(errors)
+        if not response.content:
+            # 204 No Content and other empty responses carry no errors to inspect
+            return None
+        returned_data = pydantic_core.from_json(response.content)
+        if isinstance(returned_data, dict):
+            for error_key in cls._error_keys:
+                if error_key in returned_data:
+                    raise LunchMoneyHTTPError(returned_data[error_key])
         return returned_data
 
+    @classmethod
+    def _prepare_request(
+        cls,
+        url_path: Union[list[Union[str, int]], str, int],
+        params: Optional[Mapping[str, Any]] = None,
+        payload: Optional[Any] = None,
+    ) -> Tuple[str, Any, Optional[bytes]]:
+        """
+        Build the URL, JSON-safe query params, and JSON body for a request
+
+        Shared by :meth:`.LunchMoney.make_request` and
+        :meth:`.LunchMoney.amake_request`.
+
+        Parameters
+        ----------
+        url_path: Union[List[Union[str, int]], str, int]
+            URL components to make into a URL
+        params: Optional[Mapping[str, Any]]
+            Query string params to make JSON-safe
+        payload: Optional[Any]
+            Data to serialize as JSON, `bytes` are passed through as-is
+
+        Returns
+        -------
+        Tuple[str, Any, Optional[bytes]]
+        """
+        url = APIConfig.make_url(url_path=url_path)
+        if isinstance(payload, bytes):
+            json_safe_payload: Optional[bytes] = payload
+        else:
+            json_safe_payload = pydantic_core.to_json(payload) if payload else None
+        json_safe_params = pydantic_core.to_jsonable_python(params) if params else None
+        return url, json_safe_params, json_safe_payload
+
     def make_request(
         self,
         method: str,
@@ -301,8 +458,9 @@ class LunchMoneyAPIClient:
             PATCH, or DELETE
         url_path: Union[List[Union[str, int]], str, int]
             URL components to make into a URL
-        payload: Optional[Mapping[str, Any]]
-            Data to send in the body of the Request.
+        payload: Optional[Any]
+            Data to send in the body of the Request. `bytes` are assumed to
+            be JSON already and are sent as-is.
         params: Optional[Mapping[str, Any]]
             Dictionary, list of tuples or bytes to send in the query
             string for the Request.
@@ -313,9 +471,9 @@ class LunchMoneyAPIClient:
         -------
         Any
         """
-        url = APIConfig.make_url(url_path=url_path)
-        json_safe_payload = pydantic_core.to_json(payload) if payload else None
-        json_safe_params = pydantic_core.to_jsonable_python(params)
+        url, json_safe_params, json_safe_payload = self._prepare_request(
+            url_path=url_path, params=params, payload=payload
+        )
         response = self.request(
             method=method,
             url=url,
@@ -347,8 +505,9 @@ class LunchMoneyAPIClient:
             PATCH, or DELETE
         url_path: Union[List[Union[str, int]], str, int]
             URL components to make into a URL
-        payload: Optional[Mapping[str, Any]]
-            Data to send in the body of the Request.
+        payload: Optional[Any]
+            Data to send in the body of the Request. `bytes` are assumed to
+            be JSON already and are sent as-is.
         params: Optional[Mapping[str, Any]]
             Dictionary, list of tuples or bytes to send in the query
             string for the Request.
@@ -359,14 +518,14 @@ class LunchMoneyAPIClient:
         -------
         Any
         """
-        url = APIConfig.make_url(url_path=url_path)
-        json_safe_payload = pydantic_core.to_jsonable_python(payload)
-        json_safe_params = pydantic_core.to_jsonable_python(params)
+        url, json_safe_params, json_safe_payload = self._prepare_request(
+            url_path=url_path, params=params, payload=payload
+        )
         response = await self.arequest(
             method=method,
             url=url,
             params=json_safe_params,
-            data=json_safe_payload,
+            content=json_safe_payload,
             **kwargs,
         )
         data = self.process_response(response=response)
@@ -57,7 +57,12 @@ class LunchMoney(
     ```
     """
 
-    def __init__(self, access_token: Optional[str] = None):
+    def __init__(
+        self,
+        access_token: Optional[str] = None,
+        rate_limit_retries: int = 5,
+        http2: bool = False,
+    ):
         """
         Initialize a Lunch Money object with an Access Token.
 
@@ -67,5 +72,15 @@ class LunchMoney(
         ----------
         access_token: Optional[str]
             Lunchmoney Developer API Access Token
+        rate_limit_retries: int
+            How many times to retry a rate limited (HTTP 429) request before
+            returning the 429 response. Set to 0 to disable retries. Defaults to 5.
+        http2: bool
+            Send requests over HTTP/2. Requires the `lunchable[http2]` extra.
+            Defaults to False.
         """
-        super(LunchMoney, self).__init__(access_token=access_token)
+        super(LunchMoney, self).__init__(
+            access_token=access_token,
+            rate_limit_retries=rate_limit_retries,
+            http2=http2,
+        )
@@ -8,7 +8,7 @@ import datetime
 import logging
 from typing import Any, Dict, List, Optional
 
-from pydantic import Field
+from pydantic import Field, TypeAdapter
 
 from lunchable._config import APIConfig
 from lunchable.models._base import LunchableModel
@@ -78,6 +78,10 @@ class BudgetObject(LunchableModel):
     )
 
 
+# Validates a full `get_budgets` response in a single pydantic-core pass
+_budget_list_adapter: TypeAdapter[List[BudgetObject]] = TypeAdapter(List[BudgetObject])
+
+
 class BudgetParamsGet(LunchableModel):
     """
     https://lunchmoney.dev/#get-budget-summary
@@ -126,13 +130,46 @@ class BudgetsClient(LunchMoneyAPIClient):
         -------
         List[BudgetObject]
         """
-        params = BudgetParamsGet(start_date=start_date, end_date=end_date).model_dump()
+        params = BudgetParamsGet(start_date=start_date, end_date=end_date).model_dump(
+            mode="json"
+        )
         response_data = self.make_request(
             method=self.Methods.GET,
             url_path=[APIConfig.LUNCHMONEY_BUDGET],
             params=params,
         )
-        budget_objects = [BudgetObject.model_validate(item) for item in response_data]
+        budget_objects = _budget_list_adapter.validate_python(response_data)
+        return budget_objects
+
+    async def aget_budgets(
+        self, start_date: datetime.date, end_date: datetime.date
+    ) -> List[BudgetObject]:
+        """
+        Get Monthly Budgets (async)
+
+        Async version of :meth:`.get_budgets`, useful for fetching many budget
+        periods concurrently with `asyncio.gather`.
+
+        Parameters
+        ----------
+        start_date : date
+            Start date for the budget period
+        end_date : date
+            End date for the budget period
+
+        Returns
+        -------
+        List[BudgetObject]
+        """
+        params = BudgetParamsGet(start_date=start_date, end_date=end_date).model_dump(
+            mode="json"
+        )
+        response_data = await self.amake_request(
+            method=self.Methods.GET,
+            url_path=[APIConfig.LUNCHMONEY_BUDGET],
+            params=params,
+        )
+        budget_objects = _budget_list_adapter.validate_python(response_data)
         return budget_objects
 
     def upsert_budget(
@@ -179,7 +216,7 @@ class BudgetsClient(LunchMoneyAPIClient):
             category_id=category_id,
             amount=amount,
             currency=currency,
-        ).model_dump(exclude_none=True)
+        ).model_dump(mode="json", exclude_none=True)
         response_data = self.make_request(
             method=self.Methods.PUT,
             url_path=[APIConfig.LUNCHMONEY_BUDGET],
@@ -206,7 +243,7 @@ class BudgetsClient(LunchMoneyAPIClient):
         """
         params = BudgetParamsRemove(
             start_date=start_date, category_id=category_id
-        ).model_dump()
+        ).model_dump(mode="json")
         response_data = self.make_request(
             method=self.Methods.DELETE,
             url_path=[APIConfig.LUNCHMONEY_BUDGET],
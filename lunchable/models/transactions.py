@@ -7,7 +7,7 @@ https://lunchmoney.dev/#transactions
 import datetime
 import logging
 from enum import Enum
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, Iterator, List, Optional, Union
 
 import pydantic_core
 from pydantic import Field, field_validator
@@ -526,6 +526,111 @@ class TransactionsClient(LunchMoneyAPIClient):
                                               end_date="2020-01-31")
         ```
         """
+        return list(
+            self.iter_transactions(
+                start_date=start_date,
+                end_date=end_date,
+                tag_id=tag_id,
+                recurring_id=recurring_id,
+                plaid_account_id=plaid_account_id,
+                category_id=category_id,
+                asset_id=asset_id,
+                group_id=group_id,
+                is_group=is_group,
+                status=status,
+                offset=offset,
+                limit=limit,
+                debit_as_negative=debit_as_negative,
+                pending=pending,
+                params=params,
+            )
+        )
+
+    def iter_transactions(
+        self,
+        start_date: Optional[Union[datetime.date, datetime.datetime, str]] = None,
+        end_date: Optional[Union[datetime.date, datetime.datetime, str]] = None,
+        tag_id: Optional[int] = None,
+        recurring_id: Optional[int] = None,
+        plaid_account_id: Optional[int] = None,
+        category_id: Optional[int] = None,
+        asset_id: Optional[int] = None,
+        group_id: Optional[int] = None,
+        is_group: Optional[bool] = None,
+        status: Optional[str] = None,
+        offset: Optional[int] = None,
+        limit: Optional[int] = None,
+        debit_as_negative: Optional[bool] = None,
+        pending: Optional[bool] = None,
+        params: Optional[Dict[str, Any]] = None,
+    ) -> Iterator[TransactionObject]:
+        """
+        Iterate Over Transactions Using Criteria
+
+        Lazy version of :meth:`.get_transactions` - transactions are yielded one
+        page at a time, and the next page is only requested once the current one
+        has been consumed. Breaking out of the loop early skips any remaining
+        pages. If no query parameters are set, this will yield transactions for
+        the current calendar month.
+
+        Parameters
+        ----------
+        start_date: Optional[Union[datetime.date, datetime.datetime, str]]
+            Denotes the beginning of the time period to fetch transactions for. Defaults
+            to beginning of current month. Required if end_date exists. Format: YYYY-MM-DD.
+        end_date: Optional[Union[datetime.date, datetime.datetime, str]]
+            Denotes the end of the time period you'd like to get transactions for.
+            Defaults to end of current month. Required if start_date exists.
+        tag_id: Optional[int]
+            Filter by tag. Only accepts IDs, not names.
+        recurring_id: Optional[int]
+            Filter by recurring expense
+        plaid_account_id: Optional[int]
+            Filter by Plaid account
+        category_id: Optional[int]
+            Filter by category. Will also match category groups.
+        asset_id: Optional[int]
+            Filter by asset
+        group_id: Optional[int]
+            Filter by group_id (if the transaction is part of a specific group)
+        is_group: Optional[bool]
+            Filter by group (returns transaction groups)
+        status: Optional[str]
+            Filter by status (Can be cleared or uncleared. For recurring
+            transactions, use recurring)
+        offset: Optional[int]
+            Sets the offset for the records returned (disables
+            automatic pagination)
+        limit: Optional[int]
+            Sets the maximum number of records to return. Defaults to 1000
+             (disables automatic pagination)
+        debit_as_negative: Optional[bool]
+            Pass in true if you'd like expenses to be returned as negative amounts and
+            credits as positive amounts. Defaults to false.
+        pending: Optional[bool]
+            Pass in true if you'd like to include imported transactions with a pending status.
+        params: Optional[dict]
+            Additional Query String Params
+
+        Returns
+        -------
+        Iterator[TransactionObject]
+            An iterator of transactions
+
+        Examples
+        --------
+        Stop fetching transactions once a large one is found
+
+        ```python
+        from lunchable import LunchMoney
+
+        lunch = LunchMoney(access_token="xxxxxxx")
+        for transaction in lunch.iter_transactions(start_date="2020-01-01",
+                                                   end_date="2020-12-31"):
+            if transaction.amount > 1000:
+                break
+        ```
+        """
         search_params = _TransactionParamsGet(
             tag_id=tag_id,
             recurring_id=recurring_id,
@@ -541,7 +646,7 @@ class TransactionsClient(LunchMoneyAPIClient):
             end_date=end_date,
             debit_as_negative=debit_as_negative,
             pending=pending,
-        ).model_dump(exclude_none=True)
+        ).model_dump(mode="json", exclude_none=True)
         search_params.update(params if params is not None else {})
         auto_paginate = all(
             [
@@ -551,39 +656,35 @@ class TransactionsClient(LunchMoneyAPIClient):
                 search_params.get("limit") is None,
             ]
         )
-        transactions = self._get_transactions(
+        return self._iter_transactions(
             search_params=search_params,
             paginate=auto_paginate,
         )
-        return transactions
 
-    def _get_transactions(
+    def _iter_transactions(
         self,
         search_params: Dict[str, Any],
-        existing_transactions: Optional[List[TransactionObject]] = None,
         paginate: bool = True,
-    ) -> List[TransactionObject]:
+    ) -> Iterator[TransactionObject]:
         """
-        Paginate Transactions
+        Paginate Transactions, Lazily Requesting One Page at a Time
         """
-        existing_transactions = existing_transactions or []
-        transaction_response = self.make_request(
-            method=self.Methods.GET,
-            url_path=APIConfig.LUNCHMONEY_TRANSACTIONS,
-            params=search_params,
-        )
-        transaction_response = _TransactionsResponse.model_validate(
-            transaction_response
-        )
-        existing_transactions.extend(transaction_response.transactions)
-        if transaction_response.has_more and paginate:
-            search_params["offset"] = len(existing_transactions)
-            return self._get_transactions(
-                existing_transactions=existing_transactions,
-                search_params=search_params,
-                paginate=True,
+        transaction_count = 0
+        while True:
+            response_data = self.make_request(
+                method=self.Methods.GET,
+                url_path=APIConfig.LUNCHMONEY_TRANSACTIONS,
+                params=search_params,
             )
-        return existing_transactions
+            transaction_response = _TransactionsResponse.model_validate(response_data)
+            yield from transaction_response.transactions
+            if not transaction_response.transactions:
+                # An empty page means there's nothing left, even if has_more says so
+                return
+            transaction_count += len(transaction_response.transactions)
+            if not (transaction_response.has_more and paginate):
+                return
+            search_params["offset"] = transaction_count
 
     def get_transaction(
         self, transaction_id: int, debit_as_negative: Optional[bool] = None
@@ -623,7 +724,7 @@ class TransactionsClient(LunchMoneyAPIClient):
             url_path=[APIConfig.LUNCHMONEY_TRANSACTIONS, transaction_id],
             params={"debit_as_negative": debit_as_negative}
             if debit_as_negative is not None
-            else {},
+            else None,
         )
         return TransactionObject.model_validate(response_data)
 
@@ -715,13 +816,15 @@ class TransactionsClient(LunchMoneyAPIClient):
             split=split,
             debit_as_negative=debit_as_negative,
             skip_balance_update=skip_balance_update,
-        ).model_dump(exclude_none=True)
+        ).model_dump(mode="json", exclude_none=True)
         if transaction is None and split is None:
             raise LunchMoneyError("You must update the transaction or provide a split")
         elif transaction is not None:
             if isinstance(transaction, TransactionObject):
                 transaction = transaction.get_update_object()
-            payload["transaction"] = transaction.model_dump(exclude_unset=True)
+            payload["transaction"] = transaction.model_dump(
+                mode="json", exclude_unset=True
+            )
         response_data = self.make_request(
             method=self.Methods.PUT,
             url_path=[APIConfig.LUNCHMONEY_TRANSACTIONS, transaction_id],
@@ -802,14 +905,15 @@ class TransactionsClient(LunchMoneyAPIClient):
                     "Only TransactionObjects or TransactionInsertObjects are "
                     "supported by this function."
                 )
-        payload = _TransactionInsertParamsPost(
+        insert_params = _TransactionInsertParamsPost(
             transactions=insert_objects,
             apply_rules=apply_rules,
             skip_duplicates=skip_duplicates,
             check_for_recurring=check_for_recurring,
             debit_as_negative=debit_as_negative,
             skip_balance_update=skip_balance_update,
-        ).model_dump(exclude_none=True)
+        )
+        payload = pydantic_core.to_json(insert_params, exclude_none=True)
         response_data = self.make_request(
             method=self.Methods.POST,
             url_path=APIConfig.LUNCHMONEY_TRANSACTIONS,
@@ -851,18 +955,14 @@ class TransactionsClient(LunchMoneyAPIClient):
         -------
         int
         """
-        if len(transactions) < 2:
-            raise LunchMoneyError(
-                "You must include 2 or more transactions " "in the Transaction Group"
-            )
-        transaction_params = _TransactionGroupParamsPost(
+        transaction_params = self._transaction_group_params(
             date=date,
             payee=payee,
+            transactions=transactions,
             category_id=category_id,
             notes=notes,
             tags=tags,
-            transactions=transactions,
-        ).model_dump(exclude_none=True)
+        )
         response_data = self.make_request(
             method=self.Methods.POST,
             url_path=[
@@ -873,6 +973,84 @@ class TransactionsClient(LunchMoneyAPIClient):
         )
         return response_data
 
+    async def ainsert_transaction_group(
+        self,
+        date: datetime.date,
+        payee: str,
+        transactions: List[int],
+        category_id: Optional[int] = None,
+        notes: Optional[str] = None,
+        tags: Optional[List[int]] = None,
+    ) -> int:
+        """
+        Create a Transaction Group of Two or More Transactions (async)
+
+        Async version of :meth:`.insert_transaction_group`, useful for creating
+        many transaction groups concurrently with `asyncio.gather`.
+
+        Parameters
+        ----------
+        date: datetime.date
+            Date for the grouped transaction
+        payee: str
+            Payee name for the grouped transaction
+        category_id: Optional[int]
+            Category for the grouped transaction
+        notes: Optional[str]
+            Notes for the grouped transaction
+        tags: Optional[List[int]]
+            Array of tag IDs for the grouped transaction
+        transactions: Optional[List[int]]
+            Array of transaction IDs to be part of the transaction group
+
+        Returns
+        -------
+        int
+        """
+        transaction_params = self._transaction_group_params(
+            date=date,
+            payee=payee,
+            transactions=transactions,
+            category_id=category_id,
+            notes=notes,
+            tags=tags,
+        )
+        response_data = await self.amake_request(
+            method=self.Methods.POST,
+            url_path=[
+                APIConfig.LUNCHMONEY_TRANSACTIONS,
+                APIConfig.LUNCHMONEY_TRANSACTION_GROUPS,
+            ],
+            payload=transaction_params,
+        )
+        return response_data
+
+    @staticmethod
+    def _transaction_group_params(
+        date: datetime.date,
+        payee: str,
+        transactions: List[int],
+        category_id: Optional[int] = None,
+        notes: Optional[str] = None,
+        tags: Optional[List[int]] = None,
+    ) -> bytes:
+        """
+        Validate and Serialize the JSON Payload for Creating a Transaction Group
+        """
+        if len(transactions) < 2:
+            raise LunchMoneyError(
+                "You must include 2 or more transactions " "in the Transaction Group"
+            )
+        transaction_params = _TransactionGroupParamsPost(
+            date=date,
+            payee=payee,
+            category_id=category_id,
+            notes=notes,
+            tags=tags,
+            transactions=transactions,
+        )
+        return pydantic_core.to_json(transaction_params, exclude_none=True)
+
     def remove_transaction_group(self, transaction_group_id: int) -> List[int]:
         """
         Delete a Transaction Group
@@ -903,6 +1081,36 @@ class TransactionsClient(LunchMoneyAPIClient):
         )
         return response_data["transactions"]
 
+    async def aremove_transaction_group(self, transaction_group_id: int) -> List[int]:
+        """
+        Delete a Transaction Group (async)
+
+        Async version of :meth:`.remove_transaction_group`. The transactions within
+        the group will not be removed.
+
+        Returns the IDs of the transactions that were part of the deleted group
+
+        https://lunchmoney.dev/#delete-transaction-group
+
+        Parameters
+        ----------
+        transaction_group_id: int
+            Transaction Group Identifier
+
+        Returns
+        -------
+        List[int]
+        """
+        response_data = await self.amake_request(
+            method=self.Methods.DELETE,
+            url_path=[
+                APIConfig.LUNCHMONEY_TRANSACTIONS,
+                APIConfig.LUNCHMONEY_TRANSACTION_GROUPS,
+                transaction_group_id,
+            ],
+        )
+        return response_data["transactions"]
+
     def unsplit_transactions(
         self, parent_ids: List[int], remove_parents: Optional[bool] = None
     ) -> List[int]:
@@ -2,6 +2,7 @@
 Run Tests on the Budgets Endpoint
 """
 
+import asyncio
 import datetime
 import logging
 
@@ -44,6 +45,24 @@ def test_get_budgets(
     logger.info(budgets)
 
 
+@lunchable_cassette("tests/models/test_get_budgets")
+def test_aget_budgets(
+    lunch_money_obj: LunchMoney, obscure_start_date: datetime.datetime
+):
+    """
+    Test Getting some budgets with the async method
+    """
+    budgets = asyncio.run(
+        lunch_money_obj.aget_budgets(
+            start_date=obscure_start_date,
+            end_date=obscure_start_date + datetime.timedelta(days=28),
+        )
+    )
+    assert len(budgets) >= 1
+    for budget in budgets:
+        assert isinstance(budget, BudgetObject)
+
+
 @lunchable_cassette
 def test_delete_budget(
     lunch_money_obj: LunchMoney, obscure_start_date: datetime.datetime
@@ -0,0 +1,195 @@
+"""
+Run Tests on the Core API Client
+"""
+
+import asyncio
+import datetime
+import email.utils
+from typing import List
+
+import httpx
+import pytest
+from pytest_mock import MockerFixture
+
+from lunchable import LunchMoney
+from lunchable.exceptions import LunchMoneyHTTPError
+
+
+def _rate_limited_transport(responses: List[httpx.Response]) -> httpx.MockTransport:
+    """
+    Mock Transport that replays responses in order
+    """
+    replay = iter(responses)
+    return httpx.MockTransport(lambda request: next(replay))
+
+
+def test_rate_limit_retry(lunch_money_obj: LunchMoney, mocker: MockerFixture):
+    """
+    Retry a 429 response, honoring the Retry-After header
+    """
+    sleep = mocker.patch("lunchable.models._core._sleep")
+    lunch_money_obj.session = httpx.Client(
+        transport=_rate_limited_transport(
+            [
+                httpx.Response(429, headers={"Retry-After": "2"}),
+                httpx.Response(200, json={"user_id": 1}),
+            ]
+        )
+    )
+    response = lunch_money_obj.make_request(
+        method=lunch_money_obj.Methods.GET, url_path="me"
+    )
+    assert response == {"user_id": 1}
+    sleep.assert_called_once()
+    assert 2 <= sleep.call_args.args[0] < 3
+
+
+def test_rate_limit_retry_exhausted_async(
+    lunch_money_obj: LunchMoney, mocker: MockerFixture
+):
+    """
+    Return the final 429 response once async retries are exhausted
+    """
+    sleep = mocker.patch("lunchable.models._core._async_sleep")
+    retries = lunch_money_obj.rate_limit_retries
+    lunch_money_obj.async_session = httpx.AsyncClient(
+        transport=_rate_limited_transport(
+            [httpx.Response(429) for _ in range(retries + 1)]
+        )
+    )
+    response = asyncio.run(
+        lunch_money_obj.arequest(
+            method=lunch_money_obj.Methods.GET, url="https://dev.lunchmoney.app/v1/me"
+        )
+    )
+    assert response.status_code == 429
+    assert sleep.call_count == retries
+
+
+def test_rate_limit_retry_exhausted_sync(
+    lunch_money_obj: LunchMoney, mocker: MockerFixture
+):
+    """
+    Raise on the final 429 response once sync retries are exhausted
+    """
+    sleep = mocker.patch("lunchable.models._core._sleep")
+    retries = lunch_money_obj.rate_limit_retries
+    lunch_money_obj.session = httpx.Client(
+        transport=_rate_limited_transport(
+            [httpx.Response(429) for _ in range(retries + 1)]
+        )
+    )
+    with pytest.raises(LunchMoneyHTTPError):
+        lunch_money_obj.make_request(method=lunch_money_obj.Methods.GET, url_path="me")
+    assert sleep.call_count == retries
+
+
+def test_rate_limit_retry_disabled(mocker: MockerFixture):
+    """
+    Return the 429 response right away when retries are disabled
+    """
+    sleep = mocker.patch("lunchable.models._core._sleep")
+    lunch_money_obj = LunchMoney(rate_limit_retries=0)
+    lunch_money_obj.session = httpx.Client(
+        transport=_rate_limited_transport([httpx.Response(429)])
+    )
+    response = lunch_money_obj.request(
+        method=lunch_money_obj.Methods.GET, url="https://dev.lunchmoney.app/v1/me"
+    )
+    assert response.status_code == 429
+    sleep.assert_not_called()
+
+
+@pytest.mark.parametrize("retry_after", ["-5", "nan", "inf", "soon"])
+def test_rate_limit_retry_invalid_header(
+    lunch_money_obj: LunchMoney, mocker: MockerFixture, retry_after: str
+):
+    """
+    Fall back to exponential backoff for an invalid Retry-After header
+    """
+    sleep = mocker.patch("lunchable.models._core._sleep")
+    lunch_money_obj.session = httpx.Client(
+        transport=_rate_limited_transport(
+            [
+                httpx.Response(429, headers={"Retry-After": retry_after}),
+                httpx.Response(200, json={"user_id": 1}),
+            ]
+        )
+    )
+    response = lunch_money_obj.make_request(
+        method=lunch_money_obj.Methods.GET, url_path="me"
+    )
+    assert response == {"user_id": 1}
+    sleep.assert_called_once()
+    assert 1 <= sleep.call_args.args[0] < 2
+
+
+def test_rate_limit_retry_http_date(lunch_money_obj: LunchMoney, mocker: MockerFixture):
+    """
+    Wait until the HTTP-date given in a Retry-After header
+    """
+    sleep = mocker.patch("lunchable.models._core._sleep")
+    retry_at = datetime.datetime.now(tz=datetime.timezone.utc) + datetime.timedelta(
+        seconds=10
+    )
+    lunch_money_obj.session = httpx.Client(
+        transport=_rate_limited_transport(
+            [
+                httpx.Response(
+                    429,
+                    headers={"Retry-After": email.utils.format_datetime(retry_at)},
+                ),
+                httpx.Response(200, json={"user_id": 1}),
+            ]
+        )
+    )
+    lunch_money_obj.make_request(method=lunch_money_obj.Methods.GET, url_path="me")
+    sleep.assert_called_once()
+    # HTTP-dates have one second resolution, plus up to a second of jitter
+    assert 8 <= sleep.call_args.args[0] < 11
+
+
+def test_rate_limit_retry_streaming_body(
+    lunch_money_obj: LunchMoney, mocker: MockerFixture
+):
+    """
+    Return the 429 response as-is when the request body is a consumed stream
+    """
+    sleep = mocker.patch("lunchable.models._core._sleep")
+    sent: List[bytes] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        sent.append(request.read())
+        return httpx.Response(429)
+
+    lunch_money_obj.session = httpx.Client(transport=httpx.MockTransport(handler))
+    response = lunch_money_obj.request(
+        method=lunch_money_obj.Methods.POST,
+        url="https://dev.lunchmoney.app/v1/transactions",
+        content=(chunk for chunk in [b"a", b"bc"]),
+    )
+    assert response.status_code == 429
+    assert sent == [b"abc"]
+    sleep.assert_not_called()
+
+
+def test_rate_limit_retries_negative():
+    """
+    Reject a negative number of rate limit retries
+    """
+    with pytest.raises(ValueError, match="rate_limit_retries"):
+        LunchMoney(rate_limit_retries=-1)
+
+
+@pytest.mark.parametrize("http2", [False, True])
+def test_http2_opt_in(mocker: MockerFixture, http2: bool):
+    """
+    HTTP/2 is only used when requested
+    """
+    client = mocker.patch("lunchable.models._core.LunchMoneyClient")
+    async_client = mocker.patch("lunchable.models._core.LunchMoneyAsyncClient")
+    lunch = LunchMoney(http2=http2) if http2 else LunchMoney()
+    assert lunch.session is client.return_value
+    assert lunch.async_session is async_client.return_value
+    client.assert_called_once_with(access_token=lunch.access_token, http2=http2)
+    async_client.assert_called_once_with(access_token=lunch.access_token, http2=http2)
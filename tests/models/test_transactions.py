@@ -2,11 +2,14 @@
 Run Tests on the Transactions Endpoint
 """
 
+import asyncio
 import datetime
 import logging
 from time import sleep
 from typing import List
 
+from pytest_mock import MockerFixture
+
 from lunchable import LunchMoney
 from lunchable.models.transactions import (
     TransactionChildObject,
@@ -101,6 +104,31 @@ def test_create_and_delete_transaction_group(
     logger.info("Transactions part of group: %s", response)
 
 
+@lunchable_cassette("tests/models/test_create_and_delete_transaction_group")
+def test_acreate_and_delete_transaction_group(
+    lunch_money_obj: LunchMoney, test_transactions: List[TransactionObject]
+):
+    """
+    Create and delete a transaction group with the async methods
+    """
+
+    async def create_and_delete() -> List[int]:
+        group_id = await lunch_money_obj.ainsert_transaction_group(
+            date=datetime.datetime.now().date(),
+            payee="Test",
+            notes="Test Transaction Group",
+            transactions=[test_transactions[1].id, test_transactions[2].id],
+        )
+        assert isinstance(group_id, int)
+        return await lunch_money_obj.aremove_transaction_group(
+            transaction_group_id=group_id
+        )
+
+    response = asyncio.run(create_and_delete())
+    for transaction_id in response:
+        assert isinstance(transaction_id, int)
+
+
 @lunchable_cassette
 def test_split_transaction(lunch_money_obj: LunchMoney):
     """
@@ -183,3 +211,48 @@ def test_get_transactions_no_paginate(lunch_money_obj: LunchMoney) -> None:
     assert len(transactions) >= 1
     for transaction in transactions:
         assert isinstance(transaction, TransactionObject)
+
+
+def test_iter_transactions_is_lazy(
+    lunch_money_obj: LunchMoney,
+    test_transactions: List[TransactionObject],
+    mocker: MockerFixture,
+) -> None:
+    """
+    Test iter_transactions only requests the next page once it's needed
+    """
+    pages = [
+        {
+            "transactions": [test_transactions[0].model_dump(mode="json")],
+            "has_more": True,
+        },
+        {
+            "transactions": [test_transactions[1].model_dump(mode="json")],
+            "has_more": False,
+        },
+    ]
+    make_request = mocker.patch.object(
+        lunch_money_obj, "make_request", side_effect=pages
+    )
+    transactions = lunch_money_obj.iter_transactions()
+    assert next(transactions).id == test_transactions[0].id
+    assert make_request.call_count == 1
+    assert next(transactions).id == test_transactions[1].id
+    assert make_request.call_args.kwargs["params"]["offset"] == 1
+    assert next(transactions, None) is None
+    assert make_request.call_count == 2
+
+
+def test_iter_transactions_empty_page(
+    lunch_money_obj: LunchMoney, mocker: MockerFixture
+) -> None:
+    """
+    Test iter_transactions stops on an empty page even if has_more is set
+    """
+    make_request = mocker.patch.object(
+        lunch_money_obj,
+        "make_request",
+        return_value={"transactions": [], "has_more": True},
+    )
+    assert list(lunch_money_obj.iter_transactions()) == []
+    assert make_request.call_count == 1